@@ -15,6 +15,19 @@
 """spanner_orm setup file."""
 from setuptools import setup
 
+try:
+  from Cython.Build import cythonize
+except ImportError:
+  # spanner_orm._fastpath is used as plain Python.
+  ext_modules = []
+else:
+  ext_modules = cythonize('spanner_orm/_fastpath.py', language_level=3)
+  # If compiling fails, e.g. without a C compiler, the build goes on and
+  # spanner_orm._fastpath is used as plain Python. This is set after cythonize
+  # since it doesn't carry optional over from Extension templates.
+  for ext_module in ext_modules:
+    ext_module.optional = True
+
 setup(
     name='spanner-orm',
     version='0.1.12',
@@ -24,6 +37,7 @@ setup(
     url='https://github.com/google/python-spanner-orm',
     packages=['spanner_orm', 'spanner_orm.admin'],
     include_package_data=True,
+    ext_modules=ext_modules,
     python_requires='>=3',
     install_requires=[
         'google-cloud-spanner >= 1.6, <4',
@@ -57,6 +57,7 @@ update = table_apis.update
 upsert = table_apis.upsert
 
 Model = model.Model
+set_max_concurrent_writes = model.set_max_concurrent_writes
 
 Boolean = field.Boolean
 Field = field.Field
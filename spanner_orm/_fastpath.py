@@ -0,0 +1,65 @@
+# python3
+# Copyright 2021 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per-row helpers for building and diffing models.
+
+This is plain Python, but setup.py compiles it with Cython when Cython is
+installed, using the C signatures declared in _fastpath.pxd. The compiled
+module takes precedence on import; otherwise this source is used as is.
+"""
+
+import copy
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+# pylint: disable=protected-access
+
+
+def from_row(cls: Type[Any], row: Iterable[Any]) -> Any:
+  """Builds a persisted model from a row of values in column order."""
+  model = cls.__new__(cls)
+  attributes = model.__dict__
+  columns, mutable_columns = cls._columns_tuple, cls._mutable_columns
+  row = tuple(row)
+  for column, value in zip(columns, row):
+    attributes[column] = value
+  if mutable_columns:
+    # A loop rather than a generator, since Cython's cpdef can't hold closures.
+    start_values = []
+    for column, value in zip(columns, row):
+      start_values.append(
+          copy.copy(value) if column in mutable_columns else value)
+    row = tuple(start_values)
+  object.__setattr__(model, '_persisted', True)
+  object.__setattr__(model, '_start_values', row)
+  return model
+
+
+def results_to_models(cls: Type[Any],
+                      results: Iterable[Iterable[Any]]) -> List[Any]:
+  """Builds a persisted model from each row of results."""
+  return [from_row(cls, result) for result in results]
+
+
+def compute_changes(
+    attributes: Dict[str, Any],
+    columns: Tuple[str, ...],
+    start_values: Tuple[Any, ...],
+) -> Dict[str, Any]:
+  """Returns the columns whose value in attributes differs from its start."""
+  changes = {}
+  for column, start_value in zip(columns, start_values):
+    value = attributes[column]
+    if value != start_value:
+      changes[column] = value
+  return changes
@@ -59,6 +59,7 @@ class SpannerMetadata(object):
           indexes=indexes[table_name],
           model_class=klass)
       klass.meta.finalize()
+      klass._cache_metadata()  # pylint: disable=protected-access
       models[table_name] = klass
 
     return models
@@ -42,6 +42,16 @@ class FieldType(abc.ABC):
   def validate_type(value: Any) -> None:
     raise NotImplementedError
 
+  @staticmethod
+  def is_mutable_type() -> bool:
+    """Whether values of this type can be modified in place.
+
+    Values of mutable types are copied when a model records its start values,
+    so that in-place modifications show up in changes(). Types whose values
+    are immutable should override this to return False to skip the copy.
+    """
+    return True
+
 
 class Field(object):
   """Represents a column in a table as a field in a model."""
@@ -69,6 +79,9 @@ class Field(object):
   def nullable(self) -> bool:
     return self._nullable
 
+  def is_mutable_type(self) -> bool:
+    return self._type.is_mutable_type()
+
   def primary_key(self) -> bool:
     return self._primary_key
 
@@ -91,6 +104,10 @@ class Boolean(FieldType):
   def grpc_type() -> type_pb2.Type:
     return type_pb2.Type(code=type_pb2.BOOL)
 
+  @staticmethod
+  def is_mutable_type() -> bool:
+    return False
+
   @staticmethod
   def validate_type(value: Any) -> None:
     if not isinstance(value, bool):
@@ -108,6 +125,10 @@ class Integer(FieldType):
   def grpc_type() -> type_pb2.Type:
     return type_pb2.Type(code=type_pb2.INT64)
 
+  @staticmethod
+  def is_mutable_type() -> bool:
+    return False
+
   @staticmethod
   def validate_type(value: Any) -> None:
     if not isinstance(value, int):
@@ -125,6 +146,10 @@ class Float(FieldType):
   def grpc_type() -> type_pb2.Type:
     return type_pb2.Type(code=type_pb2.FLOAT64)
 
+  @staticmethod
+  def is_mutable_type() -> bool:
+    return False
+
   @staticmethod
   def validate_type(value: Any) -> None:
     if not isinstance(value, (int, float)):
@@ -142,6 +167,10 @@ class String(FieldType):
   def grpc_type() -> type_pb2.Type:
     return type_pb2.Type(code=type_pb2.STRING)
 
+  @staticmethod
+  def is_mutable_type() -> bool:
+    return False
+
   @staticmethod
   def validate_type(value) -> None:
     if not isinstance(value, str):
@@ -216,6 +245,10 @@ class Timestamp(FieldType):
   def grpc_type() -> type_pb2.Type:
     return type_pb2.Type(code=type_pb2.TIMESTAMP)
 
+  @staticmethod
+  def is_mutable_type() -> bool:
+    return False
+
   @staticmethod
   def validate_type(value: Any) -> None:
     if not isinstance(value, datetime.datetime):
@@ -233,6 +266,10 @@ class BytesBase64(FieldType):
   def grpc_type() -> type_pb2.Type:
     return type_pb2.Type(code=type_pb2.BYTES)
 
+  @staticmethod
+  def is_mutable_type() -> bool:
+    return False
+
   @staticmethod
   def validate_type(value) -> None:
     if not isinstance(value, bytes):
@@ -14,10 +14,14 @@
 # limitations under the License.
 """Holds table-specific information to make querying spanner eaiser."""
 
-import collections
+import concurrent.futures
 import copy
-from typing import Any, Callable, Dict, Iterable, List, Optional, Type, TypeVar, Union
+import sys
+import threading
+import types
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union
 
+from spanner_orm import _fastpath
 from spanner_orm import api
 from spanner_orm import condition
 from spanner_orm import error
@@ -37,10 +41,65 @@ from google.cloud.spanner_v1 import transaction as spanner_transaction
 
 T = TypeVar('T')
 
+# Spanner limits the number of mutations in a single commit; each column of
+# each written row counts as one mutation.
+_MAX_MUTATIONS_PER_BATCH = 20000
+_MAX_ROWS_PER_BATCH = 1000
+
+# Batches written outside of a caller-provided transaction are independent, so
+# they are committed concurrently on a shared pool, created on first use.
+_max_concurrent_writes = 10
+_write_pool = None  # type: Optional[concurrent.futures.ThreadPoolExecutor]
+_write_pool_lock = threading.Lock()
+
+
+def set_max_concurrent_writes(max_concurrent_writes: int) -> None:
+  """Sets how many save_batch batches may be committed at the same time.
+
+  Each concurrently committed batch holds a session from the connection's
+  session pool while it runs, so this should be kept below the pool's size,
+  less whatever sessions the application's own threads use at the same time.
+
+  Args:
+    max_concurrent_writes: Maximum number of batches committed at once; 1
+      commits batches one after another
+  """
+  if max_concurrent_writes < 1:
+    raise error.SpannerError('max_concurrent_writes must be at least 1')
+  global _max_concurrent_writes, _write_pool
+  with _write_pool_lock:
+    _max_concurrent_writes = max_concurrent_writes
+    # Writes already submitted to the old pool still finish; its idle threads
+    # exit once it is no longer referenced.
+    _write_pool = None
+
+
+def _get_write_pool() -> concurrent.futures.ThreadPoolExecutor:
+  global _write_pool
+  with _write_pool_lock:
+    if _write_pool is None:
+      _write_pool = concurrent.futures.ThreadPoolExecutor(
+          max_workers=_max_concurrent_writes,
+          thread_name_prefix='spanner_orm_write')
+    return _write_pool
+
 
 class ModelMetaclass(type):
   """Populates ModelMetadata based on class attributes."""
   meta: metadata.ModelMetadata
+  # Fallback so that attribute lookups made before the cache is populated
+  # don't recurse through __getattr__.
+  _class_attributes: Dict[str, Any] = {}
+  _columns_tuple: Tuple[str, ...]
+  _columns_set: FrozenSet[str]
+  _fields_dict: Dict[str, field.Field]
+  _mutable_columns: FrozenSet[str]
+  _primary_keys_tuple: Tuple[str, ...]
+  _field_set: FrozenSet[str]
+  _primary_key_set: FrozenSet[str]
+  _relation_set: FrozenSet[str]
+  _read_header: Tuple[str, List[str]]
+  _custom_init: bool
 
   def __new__(mcs, name: str, bases: Any, attrs: Dict[str, Any], **kwargs: Any):
     parents = [base for base in bases if isinstance(base, ModelMetaclass)]
@@ -78,24 +137,59 @@ class ModelMetaclass(type):
       model_metadata.model_class = cls
       model_metadata.finalize()
     cls.meta = model_metadata
+    cls._cache_metadata()
     return cls
 
+  def _cache_metadata(cls) -> None:
+    """Caches metadata lookups that are used on per-row code paths.
+
+    Must be called again whenever cls.meta is replaced or finalized after the
+    class has been created.
+    """
+    # Column names read from Spanner's schema (see SpannerMetadata) aren't
+    # interned like identifiers in class bodies are; interning them lets dict
+    # lookups on the per-row paths match keys by identity.
+    cls._columns_tuple = tuple(
+        sys.intern(column) for column in cls.meta.columns)
+    cls._columns_set = frozenset(cls._columns_tuple)
+    cls._fields_dict = cls.meta.fields
+    # Values of these columns are copied into the start values so that in-place
+    # changes show up in Model.changes().
+    cls._mutable_columns = frozenset(
+        name for name, column in cls.meta.fields.items()
+        if column.is_mutable_type())
+    cls._primary_keys_tuple = tuple(
+        sys.intern(column) for column in cls.meta.primary_keys)
+    # Later updates take precedence, so fields shadow relations, which shadow
+    # foreign key relations, which shadow indexes.
+    class_attributes = dict(cls.meta.indexes)
+    class_attributes.update(cls.meta.foreign_key_relations)
+    class_attributes.update(cls.meta.relations)
+    class_attributes.update(cls.meta.fields)
+    cls._class_attributes = class_attributes
+    cls._read_header = (cls.meta.table, cls.meta.columns)
+    # Used by Model.__setattr__ to decide how to treat an assignment.
+    cls._field_set = frozenset(cls.meta.fields)
+    cls._primary_key_set = frozenset(cls._primary_keys_tuple)
+    cls._relation_set = frozenset(cls.meta.relations)
+    # Results are built into models without calling __init__, unless something
+    # other than Model itself defines one.
+    init_owner = next(
+        klass for klass in cls.__mro__ if '__init__' in vars(klass))
+    cls._custom_init = not isinstance(init_owner, ModelMetaclass) or any(
+        isinstance(base, ModelMetaclass) for base in init_owner.__bases__)
+
+  # Reads of every row don't depend on the model, so they share one KeySet.
+  _all_keyset = spanner.KeySet(all_=True)
+
   def __getattr__(
       cls, name: str
   ) -> Union[field.Field, relationship.Relationship,
              foreign_key_relationship.ForeignKeyRelationship, index.Index]:
-    # Unclear why pylint doesn't like this
-    # pylint: disable=unsupported-membership-test
-    if name in cls.fields:
-      return cls.fields[name]
-    elif name in cls.relations:
-      return cls.relations[name]
-    elif name in cls.foreign_key_relations:
-      return cls.foreign_key_relations[name]
-    elif name in cls.indexes:
-      return cls.indexes[name]
-    # pylint: enable=unsupported-membership-test
-    raise AttributeError(name)
+    try:
+      return cls._class_attributes[name]
+    except KeyError:
+      raise AttributeError(name) from None
 
   @property
   def column_prefix(cls) -> str:
@@ -131,7 +225,7 @@ class ModelMetaclass(type):
 
   @property
   def fields(cls) -> Dict[str, field.Field]:
-    return cls.meta.fields
+    return cls._fields_dict
 
   @property
   def table(cls):
@@ -139,7 +233,7 @@ class ModelMetaclass(type):
 
   def validate_value(cls, field_name, value, error_type=error.SpannerError):
     try:
-      cls.fields[field_name].validate(value)
+      cls._fields_dict[field_name].validate(value)
     except error.ValidationError as ex:
       context = f'Validation error for field {field_name!r}'
       raise error_type((f'{context}: {ex.args[0]}' if ex.args else context),
@@ -155,20 +249,21 @@ class Model(metaclass=ModelMetaclass):
   Note: all methods in this class should only be called on subclasses that have
   associated tables. Violating this will cause an exception to be raised.
   """
+  # Column values stay in __dict__ rather than in slots, since per-column slot
+  # descriptors would shadow the Field returned by ModelMetaclass.__getattr__.
+  __slots__ = ('__dict__', '__weakref__', '_persisted', '_start_values')
 
   def __init__(self,
                values: Dict[str, Any],
                persisted: bool = False,
                skip_validation: bool = False):
-    start_values = {}
-    self.__dict__['start_values'] = start_values
-    self.__dict__['_persisted'] = persisted
+    object.__setattr__(self, '_persisted', persisted)
 
     # If the values came from Spanner or validation is explicitly skipped, trust
     # them and skip validation
     if not persisted and not skip_validation:
       # An object is invalid if primary key values are missing
-      missing_keys = set(self._primary_keys) - set(values.keys())
+      missing_keys = set(self._primary_keys) - values.keys()
       if missing_keys:
         raise error.SpannerError(
             'All primary keys must be specified. Missing: {keys}'.format(
@@ -178,9 +273,8 @@ class Model(metaclass=ModelMetaclass):
         self._metaclass.validate_value(column, values.get(column), ValueError)
 
     for column in self._columns:
-      value = values.get(column)
-      start_values[column] = copy.copy(value)
-      self.__dict__[column] = value
+      self.__dict__[column] = values.get(column)
+    self._snapshot_start_values()
 
     for relation in self._relations:
       if relation in values:
@@ -225,9 +319,34 @@ class Model(metaclass=ModelMetaclass):
     Returns:
       A list of models, one per row in the associated Spanner table
     """
-    args = [cls.table, cls.columns, spanner.KeySet(all_=True)]
-    results = cls._execute_read(table_apis.find, transaction, args)
-    return cls._results_to_models(results)
+    return cls._results_to_models(cls._read_all(transaction))
+
+  @classmethod
+  def iter_all(
+      cls: Type[T],
+      *,
+      transaction: Optional[spanner_transaction.Transaction] = None,
+  ) -> Iterator[T]:
+    """Like all, but builds each model as the iterator is consumed.
+
+    The rows are still read from Spanner in full before the first model is
+    built; only the construction of the models is deferred.
+
+    Args:
+      transaction: The existing transaction to use, or None to start a new
+        transaction
+
+    Returns:
+      An iterator over models, one per row in the associated Spanner table
+    """
+    return cls.itermodels(cls._read_all(transaction))
+
+  @classmethod
+  def _read_all(
+      cls, transaction: Optional[spanner_transaction.Transaction]
+  ) -> List[Sequence[Any]]:
+    args = [*cls._read_header, cls._all_keyset]
+    return cls._execute_read(table_apis.find, transaction, args)
 
   @classmethod
   def count(
@@ -274,13 +393,11 @@ class Model(metaclass=ModelMetaclass):
     Returns:
       The integer result of the COUNT query
     """
-    conditions = []
-    for column, value in constraints.items():
-      if isinstance(value, list):
-        conditions.append(condition.in_list(column, value))
-      else:
-        conditions.append(condition.equal_to(column, value))
-    return cls.count(*conditions, transaction=transaction)
+    sql, parameters, param_types = query.equality_query(
+        cls, constraints, count=True)
+    args = [sql, parameters, param_types]
+    results = cls._execute_read(table_apis.sql_query, transaction, args)
+    return int(results[0][0])
 
   @classmethod
   def find(
@@ -352,14 +469,48 @@ class Model(metaclass=ModelMetaclass):
       A list containing all requested objects that exist in the table (can be
       an empty list)
     """
-    key_values = []
-    for key in keys:
-      key_values.append([key[column] for column in cls.primary_keys])
+    return cls._results_to_models(cls._read_keys(keys, transaction))
+
+  @classmethod
+  def iter_find_multi(
+      cls: Type[T],
+      keys: Iterable[Dict[str, Any]],
+      *,
+      transaction: Optional[spanner_transaction.Transaction] = None,
+  ) -> Iterator[T]:
+    """Like find_multi, but builds each model as the iterator is consumed.
+
+    The rows are still read from Spanner in full before the first model is
+    built; only the construction of the models is deferred.
+
+    Args:
+      keys: An iterable of dictionaries, each dictionary representing the set of
+        primary key values necessary to uniquely identify an object in this
+        table.
+      transaction: The existing transaction to use, or None to start a new
+        transaction
+
+    Returns:
+      An iterator over all requested objects that exist in the table
+    """
+    return cls.itermodels(cls._read_keys(keys, transaction))
+
+  @classmethod
+  def _read_keys(
+      cls,
+      keys: Iterable[Dict[str, Any]],
+      transaction: Optional[spanner_transaction.Transaction],
+  ) -> List[Sequence[Any]]:
+    primary_keys = cls._primary_keys_tuple
+    if len(primary_keys) == 1:
+      primary_key, = primary_keys
+      key_values = [[key[primary_key]] for key in keys]
+    else:
+      key_values = [[key[column] for column in primary_keys] for key in keys]
     keyset = spanner.KeySet(keys=key_values)
 
-    args = [cls.table, cls.columns, keyset]
-    results = cls._execute_read(table_apis.find, transaction, args)
-    return cls._results_to_models(results)
+    args = [*cls._read_header, keyset]
+    return cls._execute_read(table_apis.find, transaction, args)
 
   @classmethod
   def where(
@@ -384,6 +535,31 @@ class Model(metaclass=ModelMetaclass):
     results = cls._execute_read(table_apis.sql_query, transaction, args)
     return builder.process_results(results)
 
+  @classmethod
+  def iter_where(
+      cls: Type[T],
+      *conditions: condition.Condition,
+      transaction: Optional[spanner_transaction.Transaction] = None,
+  ) -> Iterator[T]:
+    """Like where, but builds each model as the iterator is consumed.
+
+    The rows are still read from Spanner in full before the first model is
+    built; only the construction of the models is deferred.
+
+    Args:
+      *conditions: Instances of subclasses of Condition that help specify which
+        objects should be retrieved
+      transaction: The existing transaction to use, or None to start a new
+        transaction
+
+    Returns:
+      An iterator over all requested objects that exist in the table
+    """
+    builder = query.SelectQuery(cls, conditions)
+    args = [builder.sql(), builder.parameters(), builder.types()]
+    results = cls._execute_read(table_apis.sql_query, transaction, args)
+    return builder.iter_results(results)
+
   @classmethod
   def where_equal(
       cls: Type[T],
@@ -404,21 +580,38 @@ class Model(metaclass=ModelMetaclass):
       A list containing all requested objects that exist in the table (can be
       an empty list)
     """
-    conditions = []
-    for column, value in constraints.items():
-      if isinstance(value, list):
-        conditions.append(condition.in_list(column, value))
-      else:
-        conditions.append(condition.equal_to(column, value))
-    return cls.where(*conditions, transaction=transaction)
+    sql, parameters, param_types = query.equality_query(cls, constraints)
+    args = [sql, parameters, param_types]
+    results = cls._execute_read(table_apis.sql_query, transaction, args)
+    return cls._results_to_models(results)
 
   @classmethod
   def _results_to_models(
       cls: Type[T],
       results: Iterable[Iterable[Any]],
   ) -> List[T]:
-    items = [dict(zip(cls.columns, result)) for result in results]
-    return [cls(item, persisted=True) for item in items]
+    if cls._custom_init:
+      return [cls._init_from_row(result) for result in results]
+    return _fastpath.results_to_models(cls, results)
+
+  @classmethod
+  def itermodels(
+      cls: Type[T],
+      results: Iterable[Iterable[Any]],
+  ) -> Iterator[T]:
+    """Lazily builds persisted models from rows of values in column order."""
+    if cls._custom_init:
+      for result in results:
+        yield cls._init_from_row(result)
+      return
+    from_row = _fastpath.from_row
+    for result in results:
+      yield from_row(cls, result)
+
+  @classmethod
+  def _init_from_row(cls: Type[T], row: Iterable[Any]) -> T:
+    """Builds a persisted model from a row through the class's __init__."""
+    return cls(dict(zip(cls._columns_tuple, row)), persisted=True)
 
   @classmethod
   def _execute_read(
@@ -489,9 +682,15 @@ class Model(metaclass=ModelMetaclass):
       transaction: The existing transaction to use, or None to start a new
         transaction
     """
-    key_list = []
-    for model in models:
-      key_list.append([getattr(model, column) for column in cls.primary_keys])
+    primary_keys = cls._primary_keys_tuple
+    if len(primary_keys) == 1:
+      primary_key, = primary_keys
+      key_list = [[model.__dict__[primary_key]] for model in models]
+    else:
+      key_list = []
+      for model in models:
+        attributes = model.__dict__
+        key_list.append([attributes[column] for column in primary_keys])
     cls._delete_by_keyset(
         transaction=transaction,
         keyset=spanner.KeySet(keys=key_list),
@@ -516,7 +715,7 @@ class Model(metaclass=ModelMetaclass):
     cls._delete_by_keyset(
         transaction=transaction,
         keyset=spanner.KeySet(
-            keys=[[keys[column] for column in cls.primary_keys]]),
+            keys=[[keys[column] for column in cls._primary_keys_tuple]]),
     )
 
   @classmethod
@@ -540,20 +739,83 @@ class Model(metaclass=ModelMetaclass):
       force_write: If true, we use UPSERT instead of UPDATE/INSERT, so no
         exceptions are thrown based on the presence or absence of data in
         Spanner
+
+    Rows are written in primary key order, in batches of a bounded number of
+    mutations. If no transaction is provided, each batch is committed
+    concurrently in its own transaction, which keeps each commit under
+    Spanner's per-commit mutation limit, but a failure may leave other batches
+    written. If a transaction is provided, every batch is part of its single
+    commit, so the batching gives no protection against that limit.
+
+    Concurrent batches each hold a session from the connection's session pool
+    while they are committed. With a small fixed-size pool, lower the
+    concurrency with set_max_concurrent_writes so that sessions aren't
+    exhausted.
     """
-    work = collections.defaultdict(list)
+    columns = cls._columns_tuple
+    if force_write:
+      upserts = []
+      for model in models:
+        attributes = model.__dict__
+        upserts.append({column: attributes[column] for column in columns})
+        object.__setattr__(model, '_persisted', True)
+      cls._write_batches(table_apis.upsert, transaction, upserts)
+      return
+
+    inserts, updates = [], []
     for model in models:
-      value = {column: getattr(model, column) for column in cls.columns}
-      if force_write:
-        api_method = table_apis.upsert
-      elif model._persisted:  # pylint: disable=protected-access
-        api_method = table_apis.update
-      else:
-        api_method = table_apis.insert
-      work[api_method].append(value)
-      model._persisted = True  # pylint: disable=protected-access
-    for api_method, values in work.items():
-      cls._execute_write(api_method, transaction, values)
+      attributes = model.__dict__
+      value = {column: attributes[column] for column in columns}
+      (updates if model._persisted else inserts).append(value)  # pylint: disable=protected-access
+      object.__setattr__(model, '_persisted', True)
+    cls._write_batches(table_apis.insert, transaction, inserts)
+    cls._write_batches(table_apis.update, transaction, updates)
+
+  @classmethod
+  def _write_batches(
+      cls,
+      db_api: Callable[..., Any],
+      transaction: Optional[spanner_transaction.Transaction],
+      values: List[Dict[str, Any]],
+  ) -> None:
+    """Writes full rows in primary key order, in mutation-capped batches."""
+    if not values:
+      return
+    primary_keys = cls._primary_keys_tuple
+    batch_rows = max(
+        1,
+        min(_MAX_MUTATIONS_PER_BATCH // len(cls._columns_tuple),
+            _MAX_ROWS_PER_BATCH))
+    # Key columns may be nullable, and Spanner sorts NULLs first.
+    values.sort(key=lambda value: tuple(
+        (value[key] is not None, value[key]) for key in primary_keys))
+    batches = [
+        values[start:start + batch_rows]
+        for start in range(0, len(values), batch_rows)
+    ]
+    if transaction is not None or len(batches) == 1:
+      for batch in batches:
+        cls._execute_write(db_api, transaction, batch)
+      return
+
+    # Validate every batch before committing any of them.
+    writes = [cls._prepare_write(batch) for batch in batches]
+    spanner_api = cls.spanner_api()
+    write_pool = _get_write_pool()
+    futures = [
+        write_pool.submit(spanner_api.run_write, db_api, cls.table, columns,
+                          rows) for columns, rows in writes
+    ]
+    done, not_done = concurrent.futures.wait(
+        futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+    # Stop batches that haven't started after a failure, but let the ones that
+    # have finish so the outcome is settled when this returns.
+    for future in not_done:
+      future.cancel()
+    concurrent.futures.wait(not_done)
+    for future in futures:
+      if not future.cancelled():
+        future.result()
 
   @classmethod
   def update(
@@ -582,36 +844,52 @@ class Model(metaclass=ModelMetaclass):
       dictionaries: Iterable[Dict[str, Any]],
   ) -> None:
     """Validates all write value types and commits write to Spanner."""
-    columns, values = None, []
-    for dictionary in dictionaries:
-      invalid_keys = set(dictionary.keys()) - set(cls.columns)
-      if invalid_keys:
-        raise error.SpannerError('Invalid keys set on {model}: {keys}'.format(
-            model=cls.__name__, keys=invalid_keys))
-
-      if columns is None:
-        columns = dictionary.keys()
-      if columns != dictionary.keys():
-        raise error.SpannerError(
-            'Attempted to update rows with different sets of keys')
-
-      for key, value in dictionary.items():
-        cls.validate_value(key, value, error.SpannerError)
-      values.append([dictionary[column] for column in columns])
-
+    columns, values = cls._prepare_write(dictionaries)
     args = [cls.table, columns, values]
     if transaction is not None:
       return db_api(transaction, *args)
     else:
       return cls.spanner_api().run_write(db_api, *args)
 
+  @classmethod
+  def _prepare_write(
+      cls,
+      dictionaries: Iterable[Dict[str, Any]],
+  ) -> Tuple[Iterable[str], List[List[Any]]]:
+    """Validates write dictionaries and converts them to columns and rows."""
+    columns, values = None, []
+    columns_set = cls._columns_set
+    validate_value = cls.validate_value
+    for dictionary in dictionaries:
+      # Keys matching the first dictionary's have already been checked.
+      if columns is None or columns != dictionary.keys():
+        invalid_keys = dictionary.keys() - columns_set
+        if invalid_keys:
+          raise error.SpannerError('Invalid keys set on {model}: {keys}'.format(
+              model=cls.__name__, keys=invalid_keys))
+
+        if columns is not None:
+          raise error.SpannerError(
+              'Attempted to update rows with different sets of keys')
+        columns = dictionary.keys()
+
+      row = []
+      for column in columns:
+        value = dictionary[column]
+        validate_value(column, value, error.SpannerError)
+        row.append(value)
+      values.append(row)
+    return columns, values
+
   def __setattr__(self, name: str, value: Any) -> None:
-    if name in self._relations:
+    # pylint: disable=protected-access
+    cls = type(self)
+    if name in cls._relation_set:
       raise AttributeError(name)
-    elif name in self._fields:
-      if name in self._primary_keys:
+    elif name in cls._field_set:
+      if name in cls._primary_key_set:
         raise AttributeError(name)
-      self._metaclass.validate_value(name, value, AttributeError)
+      cls.validate_value(name, value, AttributeError)
     super().__setattr__(name, value)
 
   @property
@@ -619,16 +897,16 @@ class Model(metaclass=ModelMetaclass):
     return type(self)
 
   @property
-  def _columns(self) -> List[str]:
-    return self._metaclass.columns
+  def _columns(self) -> Tuple[str, ...]:
+    return self._metaclass._columns_tuple  # pylint: disable=protected-access
 
   @property
   def _fields(self) -> Dict[str, field.Field]:
-    return self._metaclass.fields
+    return self._metaclass._fields_dict  # pylint: disable=protected-access
 
   @property
-  def _primary_keys(self) -> List[str]:
-    return self._metaclass.primary_keys
+  def _primary_keys(self) -> Tuple[str, ...]:
+    return self._metaclass._primary_keys_tuple  # pylint: disable=protected-access
 
   @property
   def _relations(self) -> Dict[str, relationship.Relationship]:
@@ -643,6 +921,37 @@ class Model(metaclass=ModelMetaclass):
   def _table(self) -> str:
     return self._metaclass.table
 
+  @property
+  def start_values(self) -> Mapping[str, Any]:
+    """Gets the column values that changes() compares against.
+
+    The mapping is a read-only view; assign a whole dictionary to
+    start_values to replace them.
+
+    Returns:
+      Mapping from attribute name to its value as of object creation, the last
+      reload, or the last save.
+    """
+    return types.MappingProxyType(dict(zip(self._columns, self._start_values)))
+
+  @start_values.setter
+  def start_values(self, start_values: Mapping[str, Any]) -> None:
+    object.__setattr__(
+        self, '_start_values',
+        tuple(start_values.get(column) for column in self._columns))
+
+  def _snapshot_start_values(self) -> None:
+    """Records the current column values as the baseline for changes()."""
+    attributes = self.__dict__
+    mutable_columns = self._metaclass._mutable_columns  # pylint: disable=protected-access
+    start_values = []
+    for column in self._columns:
+      value = attributes[column]
+      if column in mutable_columns:
+        value = copy.copy(value)
+      start_values.append(value)
+    object.__setattr__(self, '_start_values', tuple(start_values))
+
   @property
   def values(self) -> Dict[str, Any]:
     """Gets all attributes.
@@ -658,12 +967,8 @@ class Model(metaclass=ModelMetaclass):
     Returns:
       Dictionary mapping from changed attribute name to new value.
     """
-    values = self.values
-    return {
-        key: values[key]
-        for key in self._columns
-        if values[key] != self.start_values.get(key)
-    }
+    return _fastpath.compute_changes(self.__dict__, self._columns,
+                                     self._start_values)
 
   def delete(
       self,
@@ -676,7 +981,8 @@ class Model(metaclass=ModelMetaclass):
       transaction: The existing transaction to use, or None to start a new
         transaction
     """
-    key = [getattr(self, column) for column in self._primary_keys]
+    attributes = self.__dict__
+    key = [attributes[column] for column in self._primary_keys]
     keyset = spanner.KeySet([key])
 
     db_api = table_apis.delete
@@ -694,7 +1000,8 @@ class Model(metaclass=ModelMetaclass):
       dictionary can be used with Model.find to return the updated version of
       this object from Spanner.
     """
-    return {key: self.values[key] for key in self._primary_keys}
+    attributes = self.__dict__
+    return {key: attributes[key] for key in self._primary_keys}
 
   def reload(
       self,
@@ -715,15 +1022,12 @@ class Model(metaclass=ModelMetaclass):
     updated_object = self._metaclass.find(transaction=transaction, **self.id())
     if updated_object is None:
       return None
-    start_values = {}
-
     for column in self._columns:
-      value = getattr(updated_object, column)
-      start_values[column] = copy.copy(value)
       if column not in self._primary_keys:
-        setattr(self, column, value)
+        setattr(self, column, getattr(updated_object, column))
 
-    self.start_values = start_values
+    # The reloaded object's start values are already copies of its values.
+    object.__setattr__(self, '_start_values', updated_object._start_values)  # pylint: disable=protected-access
     self._persisted = True
     return self
 
@@ -738,6 +1042,12 @@ class Model(metaclass=ModelMetaclass):
     stored in Spanner, an exception may be thrown due to using the wrong
     API.
 
+    Without a transaction, the write is committed before this returns and
+    changes() is empty afterwards. Within a transaction, the write is only
+    committed with the transaction, so the start values are left alone: if the
+    commit aborts and the transaction function is retried, saving again still
+    sends the same changes.
+
     Args:
       transaction: The existing transaction to use, or None to start a new
         transaction
@@ -750,7 +1060,11 @@ class Model(metaclass=ModelMetaclass):
       if changed_values:
         changed_values.update(self.id())
         self._metaclass.update(transaction=transaction, **changed_values)
+        if transaction is None:
+          self._snapshot_start_values()
     else:
       self._metaclass.create(transaction=transaction, **self.values)
       self._persisted = True
+      if transaction is None:
+        self._snapshot_start_values()
     return self
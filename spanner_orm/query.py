@@ -15,11 +15,15 @@
 """Helps build SQL for complex Spanner queries."""
 
 import abc
-from typing import Any, Dict, Iterable, List, Sequence, Tuple, Type
+import collections
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple, Type
 
 from spanner_orm import condition
 from spanner_orm import error
 
+from google.cloud.spanner_v1.proto import type_pb2
+
 
 class SpannerQuery(abc.ABC):
   """Helps build SQL for complex Spanner queries."""
@@ -189,7 +193,13 @@ class SelectQuery(SpannerQuery):
   def process_results(self, results: List[Sequence[Any]]) -> List[Type[Any]]:
     return [self._process_row(result) for result in results]
 
-  def _process_row(self, row: List[Any]) -> Type[Any]:
+  def iter_results(self,
+                   results: Iterable[Sequence[Any]]) -> Iterator[Type[Any]]:
+    """Like process_results, but parses each row as it is consumed."""
+    for result in results:
+      yield self._process_row(result)
+
+  def _process_row(self, row: Sequence[Any]) -> Type[Any]:
     """Parses a row of results from a Spanner query based on the conditions."""
     values = dict(zip(self._model.columns, row))
     join_values = row[len(self._model.columns):]
@@ -210,3 +220,100 @@ class _SelectSubQuery(SelectQuery):
 
   def _select_prefix(self) -> str:
     return 'SELECT AS STRUCT'
+
+
+# Maximum number of equality query shapes kept by equality_query.
+_EQUALITY_QUERY_CACHE_SIZE = 1024
+# Pairs of (parameter name, column the parameter takes its value from).
+_ParamColumns = Tuple[Tuple[str, str], ...]
+# SQL and parameter types built for a constraint shape, and its parameters.
+_EqualityQuery = Tuple[str, Dict[str, type_pb2.Type], _ParamColumns]
+# Maps (count, model, constraint shape) to the query built for that shape, in
+# least to most recently used order.
+_equality_queries: 'collections.OrderedDict[Tuple[Any, ...], _EqualityQuery]' = (
+    collections.OrderedDict())
+_equality_queries_lock = threading.Lock()
+
+
+def _build_equality_query(
+    model: Type[Any],
+    constraints: Mapping[str, Any],
+    count: bool,
+) -> _EqualityQuery:
+  """Generates the same SQL as equal_to/in_list conditions, without them."""
+  prefix = model.column_prefix
+  if count:
+    sql = 'SELECT COUNT(*)'
+  else:
+    sql = 'SELECT {}'.format(', '.join(
+        '{}.{}'.format(prefix, column) for column in model.columns))
+  sql += ' FROM {}'.format(model.table)
+
+  wheres, types, param_columns = [], {}, []
+  for column, value in constraints.items():
+    if column not in model.fields:
+      raise error.ValidationError('{} is not a column on {}'.format(
+          column, model.table))
+    if value is None:
+      wheres.append('{}.{} IS NULL'.format(prefix, column))
+      continue
+    name = '{}{}'.format(column, len(param_columns))
+    grpc_type = model.fields[column].grpc_type()
+    if isinstance(value, list):
+      wheres.append('{}.{} IN UNNEST(@{})'.format(prefix, column, name))
+      grpc_type = type_pb2.Type(
+          code=type_pb2.ARRAY, array_element_type=grpc_type)
+    else:
+      wheres.append('{}.{} = @{}'.format(prefix, column, name))
+    types[name] = grpc_type
+    param_columns.append((name, column))
+  if wheres:
+    sql += ' WHERE {}'.format(' AND '.join(wheres))
+  return sql, types, tuple(param_columns)
+
+
+def equality_query(
+    model: Type[Any],
+    constraints: Mapping[str, Any],
+    count: bool = False,
+) -> Tuple[str, Dict[str, Any], Dict[str, type_pb2.Type]]:
+  """Builds SQL from equality constraints, reusing it for repeat shapes.
+
+  Each constraint is an equality comparison, or an IN comparison if its value
+  is a list, exactly as condition.equal_to and condition.in_list would
+  generate. As these are the only shapes allowed, the SQL is assembled
+  directly, without going through Condition and SpannerQuery objects. Queries
+  whose constraints name the same columns in the same order, with the same
+  list-ness and NULL-ness, only differ in their parameter values, so the SQL is
+  built once per shape and kept in a thread-safe LRU cache.
+
+  Args:
+    model: Model class the query is run against
+    constraints: Mapping from column name to the value it must equal
+    count: Whether to build a COUNT query instead of a SELECT of all columns
+
+  Returns:
+    The SQL, parameters and parameter types to run the query with. The types
+    are a fresh copy, so callers may modify them without affecting the cache.
+  """
+  shape = tuple((column, isinstance(value, list), value is None)
+                for column, value in constraints.items())
+  key = (count, model, shape)
+  with _equality_queries_lock:
+    cached = _equality_queries.get(key)
+    if cached is not None:
+      _equality_queries.move_to_end(key)
+  if cached is None:
+    cached = _build_equality_query(model, constraints, count)
+    with _equality_queries_lock:
+      _equality_queries[key] = cached
+      if len(_equality_queries) > _EQUALITY_QUERY_CACHE_SIZE:
+        _equality_queries.popitem(last=False)
+
+  sql, types, param_columns = cached
+  for column, value in constraints.items():
+    column_field = model.fields[column]
+    for item in (value if isinstance(value, list) else [value]):
+      column_field.validate(item)
+  parameters = {name: constraints[column] for name, column in param_columns}
+  return sql, parameters, dict(types)
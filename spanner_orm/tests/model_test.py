@@ -15,6 +15,7 @@
 import datetime
 import logging
 import os
+import threading
 import typing
 from typing import List
 import unittest
@@ -24,6 +25,7 @@ from absl.testing import parameterized
 from google.api_core import exceptions
 # TODO(https://github.com/google/pytype/issues/1081): Remove pytype disable.
 from google.cloud import spanner  # pytype: disable=import-error
+import spanner_orm
 from spanner_orm import error
 from spanner_orm import field
 from spanner_orm.testlib.spanner_emulator import testlib as spanner_emulator_testlib
@@ -63,6 +65,19 @@ class ModelTest(
     self.assertEqual(columns, models.UnittestModel.columns)
     self.assertEqual(keyset.keys, [[1, 2.3, 'string', b'A1A1']])
 
+  @mock.patch('spanner_orm.table_apis.find')
+  def test_all_calls_api(self, find):
+    mock_transaction = mock.Mock()
+    find.return_value = [['key', 'value_1', None]]
+    results = models.SmallTestModel.all(transaction=mock_transaction)
+
+    (transaction, table, columns, keyset), _ = find.call_args
+    self.assertEqual(transaction, mock_transaction)
+    self.assertEqual(table, models.SmallTestModel.table)
+    self.assertEqual(columns, models.SmallTestModel.columns)
+    self.assertTrue(keyset.all_)
+    self.assertEqual([result.key for result in results], ['key'])
+
   @mock.patch('spanner_orm.table_apis.find')
   def test_find_result(self, find):
     mock_transaction = mock.Mock()
@@ -76,6 +91,28 @@ class ModelTest(
     else:
       self.fail('Failed to find result')
 
+  @mock.patch('spanner_orm.table_apis.find')
+  def test_find_result_tracks_in_place_changes(self, find):
+    mock_transaction = mock.Mock()
+    find.return_value = [[
+        1, None, 2.3, None, 'string', None, b'A1A1', None, _TIMESTAMP, ['foo']
+    ]]
+    result = models.UnittestModel.find(
+        int_=1,
+        float_=2.3,
+        string='string',
+        bytes_=b'A1A1',
+        transaction=mock_transaction,
+    )
+
+    if result:
+      self.assertEqual(result.changes(), {})
+      string_array = typing.cast(List[str], result.string_array)
+      string_array.append('bar')
+      self.assertEqual(result.changes(), {'string_array': ['foo', 'bar']})
+    else:
+      self.fail('Failed to find result')
+
   def test_find_required(self):
     test_model = models.SmallTestModel(
         dict(
@@ -129,6 +166,39 @@ class ModelTest(
     self.assertEqual(results[0].value_1, 'value_1')
     self.assertIsNone(results[0].value_2)
 
+  @mock.patch('spanner_orm.table_apis.find')
+  def test_iter_all(self, find):
+    mock_transaction = mock.Mock()
+    find.return_value = [['key', 'value_1', None]]
+    results = models.CustomInitTestModel.iter_all(transaction=mock_transaction)
+
+    self.assertNotIsInstance(results, list)
+    self.assertEqual([result.value_2 for result in results], ['default'])
+
+  @mock.patch('spanner_orm.table_apis.find')
+  def test_all_result_uses_custom_init(self, find):
+    mock_transaction = mock.Mock()
+    find.return_value = [['key', 'value_1', None]]
+    results = models.CustomInitTestModel.all(transaction=mock_transaction)
+
+    self.assertEqual([result.value_2 for result in results], ['default'])
+
+  @mock.patch('spanner_orm.table_apis.find')
+  def test_iter_find_multi(self, find):
+    mock_transaction = mock.Mock()
+    find.return_value = [['key', 'value_1', None], ['key_2', 'value_1', None]]
+    results = models.SmallTestModel.iter_find_multi(
+        [{
+            'key': 'key'
+        }, {
+            'key': 'key_2'
+        }],
+        transaction=mock_transaction,
+    )
+
+    self.assertNotIsInstance(results, list)
+    self.assertEqual([result.key for result in results], ['key', 'key_2'])
+
   @mock.patch('spanner_orm.table_apis.insert')
   def test_create_calls_api(self, insert):
     mock_transaction = mock.Mock()
@@ -149,6 +219,26 @@ class ModelTest(
     with self.assertRaises(error.SpannerError):
       models.SmallTestModel.create(key_2='key')
 
+  def test_execute_write_error_on_invalid_keys(self):
+    valid = models.SmallTestModel({'key': 'key', 'value_1': 'value'})
+    invalid = {'key_2': 'key'}
+    with self.assertRaisesRegex(error.SpannerError, 'Invalid keys'):
+      models.SmallTestModel._execute_write(  # pylint: disable=protected-access
+          mock.Mock(),
+          mock.Mock(),
+          [valid.values, invalid],
+      )
+
+  def test_execute_write_error_on_different_keys(self):
+    full = {'key': 'a', 'value_1': 'value'}
+    partial = {'key': 'b'}
+    with self.assertRaisesRegex(error.SpannerError, 'different sets of keys'):
+      models.SmallTestModel._execute_write(  # pylint: disable=protected-access
+          mock.Mock(),
+          mock.Mock(),
+          [full, partial],
+      )
+
   def assert_api_called(self, mock_api, mock_transaction):
     mock_api.assert_called_once()
     (transaction, table, columns, values), _ = mock_api.call_args
@@ -187,6 +277,98 @@ class ModelTest(
     )
     self.assert_api_called(upsert, mock_transaction)
 
+  @mock.patch('spanner_orm.model._MAX_ROWS_PER_BATCH', 2)
+  @mock.patch('spanner_orm.table_apis.insert')
+  def test_save_batch_splits_sorted_batches(self, insert):
+    mock_transaction = mock.Mock()
+    not_persisted = [
+        models.SmallTestModel({
+            'key': key,
+            'value_1': 'value'
+        }) for key in ['c', 'a', 'b']
+    ]
+    models.SmallTestModel.save_batch(
+        not_persisted,
+        transaction=mock_transaction,
+    )
+
+    self.assertEqual(insert.call_count, 2)
+    batches = [list(values) for (_, _, _, values), _ in insert.call_args_list]
+    self.assertEqual(
+        batches,
+        [[['a', 'value', None], ['b', 'value', None]], [['c', 'value', None]]])
+
+  @mock.patch('spanner_orm.table_apis.insert')
+  def test_save_batch_sorts_null_keys_first(self, insert):
+    mock_transaction = mock.Mock()
+    not_persisted = [
+        models.NullablePrimaryKeyModel({'key': key}) for key in ['b', None]
+    ]
+    models.NullablePrimaryKeyModel.save_batch(
+        not_persisted,
+        transaction=mock_transaction,
+    )
+
+    (_, _, _, values), _ = insert.call_args
+    self.assertEqual(list(values), [[None, None], ['b', None]])
+
+  @mock.patch('spanner_orm.model._MAX_ROWS_PER_BATCH', 2)
+  @mock.patch('spanner_orm.api.spanner_api')
+  def test_save_batch_writes_batches_concurrently(self, spanner_api):
+    not_persisted = [
+        models.SmallTestModel({
+            'key': key,
+            'value_1': 'value'
+        }) for key in ['c', 'a', 'b']
+    ]
+    models.SmallTestModel.save_batch(not_persisted)
+
+    run_write = spanner_api.return_value.run_write
+    self.assertEqual(run_write.call_count, 2)
+    batches = sorted(
+        [list(rows) for (_, _, _, rows), _ in run_write.call_args_list])
+    self.assertEqual(
+        batches,
+        [[['a', 'value', None], ['b', 'value', None]], [['c', 'value', None]]])
+
+  @mock.patch('spanner_orm.model._MAX_ROWS_PER_BATCH', 1)
+  @mock.patch('spanner_orm.api.spanner_api')
+  def test_save_batch_limits_concurrent_writes(self, spanner_api):
+    spanner_orm.set_max_concurrent_writes(1)
+    self.addCleanup(spanner_orm.set_max_concurrent_writes, 10)
+    threads = set()
+    spanner_api.return_value.run_write.side_effect = (
+        lambda *args: threads.add(threading.current_thread()))
+    not_persisted = [
+        models.SmallTestModel({
+            'key': key,
+            'value_1': 'value'
+        }) for key in ['a', 'b', 'c']
+    ]
+    models.SmallTestModel.save_batch(not_persisted)
+
+    self.assertEqual(spanner_api.return_value.run_write.call_count, 3)
+    self.assertEqual(len(threads), 1)
+
+  def test_set_max_concurrent_writes_error_on_invalid_value(self):
+    with self.assertRaises(error.SpannerError):
+      spanner_orm.set_max_concurrent_writes(0)
+
+  @mock.patch('spanner_orm.model._MAX_ROWS_PER_BATCH', 2)
+  @mock.patch('spanner_orm.api.spanner_api')
+  def test_save_batch_validates_before_writing_batches(self, spanner_api):
+    not_persisted = [
+        models.SmallTestModel({
+            'key': key,
+            'value_1': 'value'
+        }) for key in ['a', 'b', 'c']
+    ]
+    not_persisted[2].__dict__['value_1'] = 1
+    with self.assertRaises(error.SpannerError):
+      models.SmallTestModel.save_batch(not_persisted)
+
+    spanner_api.return_value.run_write.assert_not_called()
+
   @mock.patch('spanner_orm.table_apis.delete')
   def test_delete_batch_deletes(self, delete):
     mock_transaction = mock.Mock()
@@ -200,6 +382,16 @@ class ModelTest(
     self.assertEqual(table, models.SmallTestModel.table)
     self.assertEqual(keyset.keys, [[model.key]])
 
+  @mock.patch('spanner_orm.table_apis.delete')
+  def test_delete_batch_deletes_composite_keys(self, delete):
+    mock_transaction = mock.Mock()
+    model = models.ChildTestModel({'key': 'key', 'child_key': 'child_key'})
+    models.ChildTestModel.delete_batch([model], transaction=mock_transaction)
+
+    delete.assert_called_once()
+    (_, _, keyset), _ = delete.call_args
+    self.assertEqual(keyset.keys, [['key', 'child_key']])
+
   @mock.patch('spanner_orm.table_apis.delete')
   def test_delete_by_key_deletes(self, delete):
     mock_transaction = mock.Mock()
@@ -379,6 +571,15 @@ class ModelTest(
     self.assertFalse(models.SmallTestModel.key.nullable())
     self.assertEqual(models.SmallTestModel.key.name, 'key')
 
+  def test_mutable_columns(self):
+    self.assertEqual(
+        models.UnittestModel._mutable_columns,  # pylint: disable=protected-access
+        {'string_array'})
+    self.assertTrue(models.UnittestModel.string_array.is_mutable_type())
+    self.assertFalse(models.UnittestModel.string.is_mutable_type())
+    # Custom types are assumed mutable unless they say otherwise.
+    self.assertTrue(field.FieldType.is_mutable_type())
+
   def test_field_inheritance(self):
     self.assertEqual(models.InheritanceTestModel.key, models.SmallTestModel.key)
 
@@ -445,6 +646,42 @@ class ModelTest(
 
     update.assert_called_once_with(**values, transaction=None)
 
+  @mock.patch('spanner_orm.model.Model.update')
+  def test_save_resets_changes(self, update):
+    values = {'key': 'key', 'value_1': 'value_1'}
+    model = models.SmallTestModel(values, persisted=True)
+    model.value_1 = 'new_value'
+    model.save()
+
+    update.assert_called_once()
+    self.assertEqual(model.changes(), {})
+    self.assertEqual(model.start_values, {
+        'key': 'key',
+        'value_1': 'new_value',
+        'value_2': None
+    })
+
+  @mock.patch('spanner_orm.table_apis.update')
+  def test_save_in_transaction_keeps_changes(self, update):
+    mock_transaction = mock.Mock()
+    values = {'key': 'key', 'value_1': 'value_1'}
+    model = models.SmallTestModel(values, persisted=True)
+    model.value_1 = 'new_value'
+    model.save(transaction=mock_transaction)
+    # An aborted commit reruns the transaction function, saving again.
+    model.save(transaction=mock_transaction)
+
+    self.assertEqual(update.call_count, 2)
+    self.assertEqual(model.changes(), {'value_1': 'new_value'})
+
+  def test_start_values_is_read_only(self):
+    model = models.SmallTestModel({'key': 'key', 'value_1': 'value_1'})
+    with self.assertRaises(TypeError):
+      model.start_values['value_1'] = 'new_value'  # pytype: disable=unsupported-operands
+
+    model.start_values = {'key': 'key', 'value_1': 'new_value'}
+    self.assertEqual(model.changes(), {'value_1': 'value_1'})
+
   @mock.patch('spanner_orm.model.Model.update')
   def test_save_no_changes(self, update):
     values = {'key': 'key', 'value_1': 'value_1'}
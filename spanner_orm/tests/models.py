@@ -98,6 +98,17 @@ class InheritanceTestModel(SmallTestModel):
   value_3 = field.Field(field.String, nullable=True)
 
 
+class CustomInitTestModel(SmallTestModel):
+  """Model class for testing that read results go through __init__."""
+
+  def __init__(self, values, persisted=False, skip_validation=False):
+    values = dict(values)
+    if values.get('value_2') is None:
+      values['value_2'] = 'default'
+    super().__init__(
+        values, persisted=persisted, skip_validation=skip_validation)
+
+
 class UnittestModel(model.Model):
   """Model class used for model testing."""
 
@@ -150,3 +161,10 @@ class NumericFloatArrayModel(model.Model):
   value_1 = field.Field(field.FloatArray)
   value_2 = field.Field(field.IntegerArray)
 
+
+class NullablePrimaryKeyModel(model.Model):
+  """Model class for testing NULL primary key values."""
+
+  __table__ = 'NullablePrimaryKeyModel'
+  key = field.Field(field.String, primary_key=True, nullable=True)
+  value = field.Field(field.String, nullable=True)
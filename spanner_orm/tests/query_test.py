@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import collections
 import datetime
 import logging
 import unittest
@@ -59,6 +60,91 @@ class QueryTest(parameterized.TestCase):
     self.assertEqual({column_key: value}, parameters)
     self.assertEqual(types, {column_key: field.Integer.grpc_type()})
 
+  @mock.patch('spanner_orm.table_apis.sql_query')
+  def test_iter_where(self, sql_query):
+    sql_query.return_value = [['key', 'value_1', None]]
+
+    results = models.SmallTestModel.iter_where(
+        condition.equal_to('key', 'key'), transaction=True)
+
+    self.assertNotIsInstance(results, list)
+    self.assertEqual([result.value_1 for result in results], ['value_1'])
+
+  @mock.patch('spanner_orm.table_apis.sql_query')
+  def test_where_equal_reuses_sql_for_same_shape(self, sql_query):
+    sql_query.return_value = []
+
+    models.UnittestModel.where_equal(int_=3, string=['a'], transaction=True)
+    (_, first_sql, _, first_types), _ = sql_query.call_args
+    models.UnittestModel.where_equal(
+        int_=4, string=['b', 'c'], transaction=True)
+    (_, sql, parameters, types), _ = sql_query.call_args
+
+    self.assertEqual(sql, first_sql)
+    self.assertEqual(types, first_types)
+    self.assertEqual(parameters, {'int_0': 4, 'string1': ['b', 'c']})
+
+  @mock.patch('spanner_orm.table_apis.sql_query')
+  def test_where_equal_validates_cached_shape(self, sql_query):
+    sql_query.return_value = []
+
+    models.UnittestModel.where_equal(int_=3, transaction=True)
+    with self.assertRaises(error.ValidationError):
+      models.UnittestModel.where_equal(int_='3', transaction=True)
+
+  def test_equality_query_returns_copy_of_cached_types(self):
+    _, _, types = query.equality_query(models.UnittestModel, {'int_': 3})
+    types.clear()
+    _, _, types = query.equality_query(models.UnittestModel, {'int_': 4})
+
+    self.assertEqual(types, {'int_0': field.Integer.grpc_type()})
+
+  @mock.patch.object(query, '_EQUALITY_QUERY_CACHE_SIZE', 2)
+  @mock.patch.object(query, '_equality_queries', collections.OrderedDict())
+  def test_equality_query_evicts_least_recently_used(self):
+    model = models.UnittestModel
+    query.equality_query(model, {'int_': 1})
+    query.equality_query(model, {'string': 'a'})
+    query.equality_query(model, {'int_': 2})
+    query.equality_query(model, {'float_': 1.0})
+
+    cached_shapes = [shape for _, _, shape in query._equality_queries]  # pylint: disable=protected-access
+    self.assertEqual(cached_shapes, [(('int_', False, False),),
+                                     (('float_', False, False),)])
+
+  @mock.patch('spanner_orm.table_apis.sql_query')
+  def test_where_equal_matches_conditions(self, sql_query):
+    sql_query.return_value = []
+
+    models.UnittestModel.where_equal(
+        int_2=None, string=['a', 'b'], int_=3, transaction=True)
+    (_, sql, parameters, types), _ = sql_query.call_args
+
+    select_query = query.SelectQuery(models.UnittestModel, [
+        condition.equal_to('int_2', None),
+        condition.in_list('string', ['a', 'b']),
+        condition.equal_to('int_', 3)
+    ])
+    self.assertEqual(sql, select_query.sql())
+    self.assertEqual(parameters, select_query.parameters())
+    self.assertEqual(types, select_query.types())
+
+  @mock.patch('spanner_orm.table_apis.sql_query')
+  def test_where_equal_builds_models_like_where(self, sql_query):
+    sql_query.return_value = [['key', 'value_1', None]]
+
+    equal_results = models.CustomInitTestModel.where_equal(
+        key='key', transaction=True)
+    where_results = models.CustomInitTestModel.where(
+        condition.equal_to('key', 'key'), transaction=True)
+
+    self.assertEqual([result.value_2 for result in equal_results], ['default'])
+    self.assertEqual([result.value_2 for result in where_results], ['default'])
+
+  def test_where_equal_error_on_invalid_column(self):
+    with self.assertRaises(error.ValidationError):
+      models.UnittestModel.where_equal(not_a_column=3, transaction=True)
+
   def test_count_allows_force_index(self):
     force_index = condition.force_index('test_index')
     count_query = query.CountQuery(models.UnittestModel, [force_index])